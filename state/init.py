@@ -22,7 +22,7 @@ from datetime import date
 # (via app.py's top-level imports) at import time.
 import outbreak_logic as jl
 
-init_game_state = getattr(jl, "init_game_state", None)
+ensure_game_state = getattr(jl, "ensure_game_state", None)
 
 logger = logging.getLogger(__name__)
 
@@ -104,8 +104,8 @@ def init_session_state():
     # Note: truth data is now loaded in main() based on scenario selection
 
     # Game state initialization (Serious Mode)
-    if init_game_state:
-        init_game_state(st.session_state)
+    if ensure_game_state:
+        ensure_game_state(st.session_state)
 
     # Alert page logic (Day 0)
     st.session_state.setdefault("alert_acknowledged", False)
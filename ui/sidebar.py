@@ -16,19 +16,15 @@ from state.progress import get_day_tasks, get_completion_summary
 def _unlock_locations_for_day(day: int) -> None:
     """Progressively unlock locations as the investigation advances."""
     scenario_id = st.session_state.get("current_scenario", "aes_sidero_valley")
-    unlocked = st.session_state.get("locations_unlocked", [])
+    unlocked = set(st.session_state.get("locations_unlocked", ()))
 
     if scenario_id == "lepto_rivergate":
         # Day 2: unlock wards that reported secondary cases
         if day >= 2:
-            for loc in ["East Terrace", "Southshore", "DRRM Office"]:
-                if loc not in unlocked:
-                    unlocked.append(loc)
+            unlocked.update(["East Terrace", "Southshore", "DRRM Office"])
         # Day 3: unlock remaining wards and investigation sites
         if day >= 3:
-            for loc in ["Highridge", "Mining Area"]:
-                if loc not in unlocked:
-                    unlocked.append(loc)
+            unlocked.update(["Highridge", "Mining Area"])
 
     st.session_state.locations_unlocked = unlocked
 
@@ -669,9 +669,6 @@ def view_nalu_child_register():
     # Get the register
     register = get_nalu_child_register()
 
-    # Convert to DataFrame for display
-    df = pd.DataFrame(register)
-
     # Instructions
     st.markdown("""
     ### Instructions
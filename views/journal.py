@@ -6,6 +6,7 @@ for tracking clues and hypotheses.
 
 import streamlit as st
 
+import outbreak_logic as jl
 from i18n.translate import t
 
 
@@ -65,9 +66,10 @@ def view_investigation_journal():
     DAY_THEMES = _get_day_themes()
 
     # Group events by day
+    events_by_day = jl.group_decision_log_by_day(decision_log)
     max_day = st.session_state.get("current_day", 1)
     for day in range(1, max_day + 1):
-        day_events = [e for e in decision_log if e.get("game_day") == day]
+        day_events = events_by_day.get(day)
         if not day_events:
             continue
 
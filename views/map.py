@@ -31,7 +31,7 @@ def get_day1_location_unlocks(scenario_id: str) -> list[str]:
 def unlock_day1_locations():
     scenario_id = st.session_state.get("current_scenario", "aes_sidero_valley")
     unlocked = get_day1_location_unlocks(scenario_id)
-    st.session_state.locations_unlocked = unlocked
+    st.session_state.locations_unlocked = set(unlocked)
 
 
 def handle_travel(target_location: str) -> bool:
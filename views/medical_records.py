@@ -33,6 +33,7 @@ def view_hospital_triage():
         st.session_state.parents_interviewed = []
 
     triage_data = jl.get_hospital_triage_list()
+    triage_by_id = jl.get_triage_index()
 
     # --- SECTION 1: THE CHECKLIST ---
     with st.container(border=True):
@@ -74,7 +75,7 @@ def view_hospital_triage():
 
         cols = st.columns(3)
         for i, patient_id in enumerate(st.session_state.line_list):
-            patient = next(p for p in triage_data if p['id'] == patient_id)
+            patient = triage_by_id[patient_id]
 
             with cols[i % 3]:
                 with st.container(border=True):
@@ -405,8 +405,9 @@ def _render_timeline_tab():
         st.info("No actions were logged during this investigation.")
         return
 
+    events_by_day = jl.group_decision_log_by_day(decision_log)
     for day in range(1, 6):
-        day_events = [e for e in decision_log if e.get("game_day") == day]
+        day_events = events_by_day.get(day)
         if not day_events:
             continue
 
@@ -11,6 +11,7 @@ import pandas as pd
 import streamlit as st
 
 import achievements
+import outbreak_logic as jl
 from config.scenarios import load_scenario_content, load_storyline_excerpt
 from i18n.translate import t
 
@@ -176,28 +177,26 @@ def render_yesterday_recap(day: int):
 
     prev_day = day - 1
     decision_log = st.session_state.get("_decision_log", [])
-    prev_events = [e for e in decision_log if e.get("game_day") == prev_day]
+    summary = jl.summarize_decision_log_by_day(
+        decision_log, st.session_state.setdefault("_decision_log_summary", {})
+    ).get(prev_day)
 
-    if not prev_events:
+    if not summary:
         return
 
-    interviews = [e for e in prev_events if e.get("type") == "interview"]
-    travels = [e for e in prev_events if e.get("type") == "travel"]
-    labs = [e for e in prev_events if e.get("type") == "lab_test"]
-    other = [e for e in prev_events if e.get("type") not in ("interview", "travel", "lab_test")]
-
-    time_spent = sum(e.get("cost_time", 0) for e in prev_events)
-    budget_spent = sum(e.get("cost_budget", 0) for e in prev_events)
+    by_type = summary["by_type"]
+    time_spent = summary["cost_time"]
+    budget_spent = summary["cost_budget"]
 
     st.markdown("### Yesterday's Accomplishments")
 
     cols = st.columns(4)
     with cols[0]:
-        st.metric("\U0001f4ac Interviews", len(interviews))
+        st.metric("\U0001f4ac Interviews", by_type.get("interview", 0))
     with cols[1]:
-        st.metric("\U0001f6b6 Locations", len(travels))
+        st.metric("\U0001f6b6 Locations", by_type.get("travel", 0))
     with cols[2]:
-        st.metric("\U0001f9ea Lab Orders", len(labs))
+        st.metric("\U0001f9ea Lab Orders", by_type.get("lab_test", 0))
     with cols[3]:
         st.metric("\u23f1\ufe0f Time Used", f"{time_spent}h")
 